@@ -52,6 +52,40 @@ class ISOSettings:
     ISO_51200 = 0x00000090
     ISO_102400 = 0x00000098
     
+    # Value code to label map, built once at class creation
+    _LABELS = {
+        ISO_50: "ISO 50",
+        ISO_100: "ISO 100",
+        ISO_125: "ISO 125",
+        ISO_160: "ISO 160",
+        ISO_200: "ISO 200",
+        ISO_250: "ISO 250",
+        ISO_320: "ISO 320",
+        ISO_400: "ISO 400",
+        ISO_500: "ISO 500",
+        ISO_640: "ISO 640",
+        ISO_800: "ISO 800",
+        ISO_1000: "ISO 1000",
+        ISO_1250: "ISO 1250",
+        ISO_1600: "ISO 1600",
+        ISO_2000: "ISO 2000",
+        ISO_2500: "ISO 2500",
+        ISO_3200: "ISO 3200",
+        ISO_4000: "ISO 4000",
+        ISO_5000: "ISO 5000",
+        ISO_6400: "ISO 6400",
+        ISO_8000: "ISO 8000",
+        ISO_10000: "ISO 10000",
+        ISO_12800: "ISO 12800",
+        ISO_16000: "ISO 16000",
+        ISO_20000: "ISO 20000",
+        ISO_25600: "ISO 25600",
+        ISO_32000: "ISO 32000",
+        ISO_40000: "ISO 40000",
+        ISO_51200: "ISO 51200",
+        ISO_102400: "ISO 102400",
+    }
+    
     @classmethod
     def get_label(cls, iso_value: int) -> str:
         """Get human-readable label for ISO value.
@@ -71,40 +105,7 @@ class ISOSettings:
                 return "ISO Auto"
                 
             # Map codes to values
-            iso_map = {
-                cls.ISO_50: "ISO 50",
-                cls.ISO_100: "ISO 100",
-                cls.ISO_125: "ISO 125",
-                cls.ISO_160: "ISO 160",
-                cls.ISO_200: "ISO 200",
-                cls.ISO_250: "ISO 250",
-                cls.ISO_320: "ISO 320",
-                cls.ISO_400: "ISO 400",
-                cls.ISO_500: "ISO 500",
-                cls.ISO_640: "ISO 640",
-                cls.ISO_800: "ISO 800",
-                cls.ISO_1000: "ISO 1000",
-                cls.ISO_1250: "ISO 1250",
-                cls.ISO_1600: "ISO 1600",
-                cls.ISO_2000: "ISO 2000",
-                cls.ISO_2500: "ISO 2500",
-                cls.ISO_3200: "ISO 3200",
-                cls.ISO_4000: "ISO 4000",
-                cls.ISO_5000: "ISO 5000",
-                cls.ISO_6400: "ISO 6400",
-                cls.ISO_8000: "ISO 8000",
-                cls.ISO_10000: "ISO 10000",
-                cls.ISO_12800: "ISO 12800",
-                cls.ISO_16000: "ISO 16000",
-                cls.ISO_20000: "ISO 20000",
-                cls.ISO_25600: "ISO 25600",
-                cls.ISO_32000: "ISO 32000",
-                cls.ISO_40000: "ISO 40000",
-                cls.ISO_51200: "ISO 51200",
-                cls.ISO_102400: "ISO 102400",
-            }
-            
-            return iso_map.get(iso_value, f"ISO {iso_value}")
+            return cls._LABELS.get(iso_value, f"ISO {iso_value}")
 
 
 class ApertureSettings:
@@ -142,6 +143,40 @@ class ApertureSettings:
     F29 = 0x00000053
     F32 = 0x00000055
     
+    # Value code to label map, built once at class creation
+    _LABELS = {
+        F1_0: "f/1.0",
+        F1_2: "f/1.2",
+        F1_4: "f/1.4",
+        F1_6: "f/1.6",
+        F1_8: "f/1.8",
+        F2_0: "f/2.0",
+        F2_2: "f/2.2",
+        F2_5: "f/2.5",
+        F2_8: "f/2.8",
+        F3_2: "f/3.2",
+        F3_5: "f/3.5",
+        F4_0: "f/4.0",
+        F4_5: "f/4.5",
+        F5_0: "f/5.0",
+        F5_6: "f/5.6",
+        F6_3: "f/6.3",
+        F7_1: "f/7.1",
+        F8_0: "f/8.0",
+        F9_0: "f/9.0",
+        F10: "f/10",
+        F11: "f/11",
+        F13: "f/13",
+        F14: "f/14",
+        F16: "f/16",
+        F18: "f/18",
+        F20: "f/20",
+        F22: "f/22",
+        F25: "f/25",
+        F29: "f/29",
+        F32: "f/32",
+    }
+    
     @classmethod
     def get_label(cls, av_value: int) -> str:
         """Get human-readable label for aperture value.
@@ -157,40 +192,7 @@ class ApertureSettings:
             return Av.get_label(av_value)
         except (NameError, AttributeError):
             # Fallback implementation
-            av_map = {
-                cls.F1_0: "f/1.0",
-                cls.F1_2: "f/1.2",
-                cls.F1_4: "f/1.4",
-                cls.F1_6: "f/1.6",
-                cls.F1_8: "f/1.8",
-                cls.F2_0: "f/2.0",
-                cls.F2_2: "f/2.2",
-                cls.F2_5: "f/2.5",
-                cls.F2_8: "f/2.8",
-                cls.F3_2: "f/3.2",
-                cls.F3_5: "f/3.5",
-                cls.F4_0: "f/4.0",
-                cls.F4_5: "f/4.5",
-                cls.F5_0: "f/5.0",
-                cls.F5_6: "f/5.6",
-                cls.F6_3: "f/6.3",
-                cls.F7_1: "f/7.1",
-                cls.F8_0: "f/8.0",
-                cls.F9_0: "f/9.0",
-                cls.F10: "f/10",
-                cls.F11: "f/11",
-                cls.F13: "f/13",
-                cls.F14: "f/14",
-                cls.F16: "f/16",
-                cls.F18: "f/18",
-                cls.F20: "f/20",
-                cls.F22: "f/22",
-                cls.F25: "f/25",
-                cls.F29: "f/29",
-                cls.F32: "f/32",
-            }
-            
-            return av_map.get(av_value, f"f/{av_value}")
+            return cls._LABELS.get(av_value, f"f/{av_value}")
 
 
 class ShutterSpeedSettings:
@@ -255,6 +257,67 @@ class ShutterSpeedSettings:
     SEC_1_6400 = 0x000000A0
     SEC_1_8000 = 0x000000A3
     
+    # Value code to label map, built once at class creation
+    _LABELS = {
+        BULB: "Bulb",
+        SEC_30: "30\"",
+        SEC_25: "25\"",
+        SEC_20: "20\"",
+        SEC_15: "15\"",
+        SEC_13: "13\"",
+        SEC_10: "10\"",
+        SEC_8: "8\"",
+        SEC_6: "6\"",
+        SEC_5: "5\"",
+        SEC_4: "4\"",
+        SEC_3_2: "3.2\"",
+        SEC_3: "3\"",
+        SEC_2_5: "2.5\"",
+        SEC_2: "2\"",
+        SEC_1_6: "1.6\"",
+        SEC_1_3: "1.3\"",
+        SEC_1: "1\"",
+        SEC_0_8: "0.8\"",
+        SEC_0_6: "0.6\"",
+        SEC_0_5: "0.5\"",
+        SEC_0_4: "0.4\"",
+        SEC_0_3: "0.3\"",
+        SEC_1_4: "1/4",
+        SEC_1_5: "1/5",
+        SEC_1_6_2: "1/6",
+        SEC_1_8: "1/8",
+        SEC_1_10: "1/10",
+        SEC_1_13: "1/13",
+        SEC_1_15: "1/15",
+        SEC_1_20: "1/20",
+        SEC_1_25: "1/25",
+        SEC_1_30: "1/30",
+        SEC_1_40: "1/40",
+        SEC_1_50: "1/50",
+        SEC_1_60: "1/60",
+        SEC_1_80: "1/80",
+        SEC_1_100: "1/100",
+        SEC_1_125: "1/125",
+        SEC_1_160: "1/160",
+        SEC_1_200: "1/200",
+        SEC_1_250: "1/250",
+        SEC_1_320: "1/320",
+        SEC_1_400: "1/400",
+        SEC_1_500: "1/500",
+        SEC_1_640: "1/640",
+        SEC_1_800: "1/800",
+        SEC_1_1000: "1/1000",
+        SEC_1_1250: "1/1250",
+        SEC_1_1600: "1/1600",
+        SEC_1_2000: "1/2000",
+        SEC_1_2500: "1/2500",
+        SEC_1_3200: "1/3200",
+        SEC_1_4000: "1/4000",
+        SEC_1_5000: "1/5000",
+        SEC_1_6400: "1/6400",
+        SEC_1_8000: "1/8000",
+    }
+    
     @classmethod
     def get_label(cls, tv_value: int) -> str:
         """Get human-readable label for shutter speed value.
@@ -270,64 +333,4 @@ class ShutterSpeedSettings:
             return Tv.get_label(tv_value)
         except (NameError, AttributeError):
             # Fallback implementation
-            tv_map = {
-                cls.BULB: "Bulb",
-                cls.SEC_30: "30\"",
-                cls.SEC_25: "25\"",
-                cls.SEC_20: "20\"",
-                cls.SEC_15: "15\"",
-                cls.SEC_13: "13\"",
-                cls.SEC_10: "10\"",
-                cls.SEC_8: "8\"",
-                cls.SEC_6: "6\"",
-                cls.SEC_5: "5\"",
-                cls.SEC_4: "4\"",
-                cls.SEC_3_2: "3.2\"",
-                cls.SEC_3: "3\"",
-                cls.SEC_2_5: "2.5\"",
-                cls.SEC_2: "2\"",
-                cls.SEC_1_6: "1.6\"",
-                cls.SEC_1_3: "1.3\"",
-                cls.SEC_1: "1\"",
-                cls.SEC_0_8: "0.8\"",
-                cls.SEC_0_6: "0.6\"",
-                cls.SEC_0_5: "0.5\"",
-                cls.SEC_0_4: "0.4\"",
-                cls.SEC_0_3: "0.3\"",
-                cls.SEC_1_4: "1/4",
-                cls.SEC_1_5: "1/5",
-                cls.SEC_1_6_2: "1/6",
-                cls.SEC_1_8: "1/8",
-                cls.SEC_1_10: "1/10",
-                cls.SEC_1_13: "1/13",
-                cls.SEC_1_15: "1/15",
-                cls.SEC_1_20: "1/20",
-                cls.SEC_1_25: "1/25",
-                cls.SEC_1_30: "1/30",
-                cls.SEC_1_40: "1/40",
-                cls.SEC_1_50: "1/50",
-                cls.SEC_1_60: "1/60",
-                cls.SEC_1_80: "1/80",
-                cls.SEC_1_100: "1/100",
-                cls.SEC_1_125: "1/125",
-                cls.SEC_1_160: "1/160",
-                cls.SEC_1_200: "1/200",
-                cls.SEC_1_250: "1/250",
-                cls.SEC_1_320: "1/320",
-                cls.SEC_1_400: "1/400",
-                cls.SEC_1_500: "1/500",
-                cls.SEC_1_640: "1/640",
-                cls.SEC_1_800: "1/800",
-                cls.SEC_1_1000: "1/1000",
-                cls.SEC_1_1250: "1/1250",
-                cls.SEC_1_1600: "1/1600",
-                cls.SEC_1_2000: "1/2000",
-                cls.SEC_1_2500: "1/2500",
-                cls.SEC_1_3200: "1/3200",
-                cls.SEC_1_4000: "1/4000",
-                cls.SEC_1_5000: "1/5000",
-                cls.SEC_1_6400: "1/6400",
-                cls.SEC_1_8000: "1/8000",
-            }
-            
-            return tv_map.get(tv_value, f"TV {tv_value}") 
\ No newline at end of file
+            return cls._LABELS.get(tv_value, f"TV {tv_value}") 
\ No newline at end of file
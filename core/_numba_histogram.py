@@ -0,0 +1,38 @@
+"""
+Parallel histogram kernel for image_utils.
+
+This module imports Numba at load time, so image_utils only imports it when
+a caller explicitly asks for the Numba histogram.
+"""
+
+import numba
+import numpy as np
+
+
+@numba.njit(parallel=True, cache=True)
+def _partial_histograms(values, levels, n_chunks):
+    """Count pixel values in parallel, one partial histogram per chunk.
+    
+    Compiled on first call and cached on disk for later processes. The
+    chunk count is passed in because reading the thread count inside the
+    kernel would stop Numba from caching it.
+    """
+    chunk = (values.size + n_chunks - 1) // n_chunks
+    partial = np.zeros((n_chunks, levels), dtype=np.int64)
+    for c in numba.prange(n_chunks):
+        for i in range(c * chunk, min((c + 1) * chunk, values.size)):
+            partial[c, values[i]] += 1
+    return partial
+
+
+def parallel_histogram(values, levels):
+    """Count pixel values using all Numba threads.
+    
+    Args:
+        values: Flat integer array of pixel values
+        levels: Number of possible pixel values
+        
+    Returns:
+        Histogram with one bin per possible pixel value
+    """
+    return _partial_histograms(values, levels, numba.get_num_threads()).sum(axis=0)
@@ -5,18 +5,10 @@ This module provides utility functions for working with the EDSDK bindings
 and converting between C++ and Python types.
 """
 
-import os
-import ctypes
-import platform
 import logging
 from typing import Any, Optional, Dict, List, Union, Tuple
 
-try:
-    from ..edsdk_bindings import *
-    from ..exceptions import CanonError, DeviceNotFoundError
-except ImportError:
-    # Allow importing this file even if bindings aren't available
-    logging.warning("Could not import EDSDK bindings.")
+from ..exceptions import CanonError, DeviceNotFoundError
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +28,7 @@ def find_cameras() -> List[Any]:
         cameras = []
         return cameras
     except Exception as e:
-        logger.error(f"Error finding cameras: {e}")
+        logger.error("Error finding cameras: %s", e)
         raise DeviceNotFoundError("No Canon cameras found. Check connections.") from e
 
 
@@ -6,52 +6,150 @@ from Canon cameras.
 """
 
 import logging
+import functools
+import importlib.util
 from typing import Any, Optional, Dict, List, Union, Tuple
 
-try:
+HAVE_NUMPY = importlib.util.find_spec("numpy") is not None
+if HAVE_NUMPY:
     import numpy as np
-    HAVE_NUMPY = True
-except ImportError:
-    HAVE_NUMPY = False
+else:
     logging.warning("NumPy not found. Image processing functionality limited.")
 
+# OpenCV wheels can be installed yet fail to import when system libraries
+# are missing, so this one needs a real import attempt
+try:
+    import cv2
+    HAVE_OPENCV = True
+except ImportError:
+    HAVE_OPENCV = False
+
+HAVE_PIL = importlib.util.find_spec("PIL") is not None
+if HAVE_PIL:
+    from PIL import Image
+    # OpenCV interpolation flag values (INTER_NEAREST..INTER_LANCZOS4) mapped
+    # to the closest PIL filter, for resizing without OpenCV
+    _PIL_RESAMPLING = {0: Image.NEAREST, 1: Image.BILINEAR, 2: Image.BICUBIC,
+                       3: Image.BOX, 4: Image.LANCZOS}
+
+# Numba is only imported when a caller asks for the parallel histogram
+HAVE_NUMBA = importlib.util.find_spec("numba") is not None
+
 logger = logging.getLogger(__name__)
 
+# Leading magic bytes of encoded image formats
+_FORMAT_SIGNATURES = {
+    "jpeg": b"\xff\xd8\xff",
+    "jpg": b"\xff\xd8\xff",
+    "png": b"\x89PNG\r\n\x1a\n",
+}
+
+# ArcSinH stretch parameters (base level on an 8-bit scale, curve strength)
+_ARCSINH_BASE = 15
+_ARCSINH_POWER = 5
+
+# Below this many pixels, thread start-up outweighs a parallel histogram
+# and np.bincount is used even when Numba is requested
+_PARALLEL_HISTOGRAM_MIN_PIXELS = 256 * 1024
 
-def edsdkimage_to_numpy(image_data: Any) -> Optional[np.ndarray]:
+
+def edsdkimage_to_numpy(image_data: Any, width: Optional[int] = None, height: Optional[int] = None,
+                        channels: int = 3, bit_depth: int = 8) -> Optional[np.ndarray]:
     """Convert EDSDK image data to a NumPy array.
     
+    The returned array is a view on the EDSDK buffer, not a copy, so it is
+    only valid while that buffer is alive. Call .copy() on the result to keep
+    the pixels after the buffer has been released.
+    
     Args:
-        image_data: Image data from EDSDK
+        image_data: Raw pixel buffer from EDSDK (any object supporting the
+            buffer protocol, such as bytes, memoryview or a ctypes array)
+        width: Image width in pixels. If width or height is omitted, a flat
+            array is returned.
+        height: Image height in pixels
+        channels: Number of channels per pixel
+        bit_depth: Significant bits per channel. Depths up to 8 are read as
+            uint8; 9 to 16 bits (e.g. 12 or 14-bit RAW) as little-endian
+            16-bit containers.
         
     Returns:
         NumPy array containing the image data, or None if conversion failed
+        
+    Raises:
+        ValueError: If bit_depth is not between 1 and 16
     """
     if not HAVE_NUMPY:
         logger.warning("NumPy not available. Cannot convert image.")
         return None
         
-    # This would be implemented to convert EDSDK image data to NumPy array
-    # For now, return a placeholder
-    return None
+    if 0 < bit_depth <= 8:
+        dtype = np.uint8
+    elif 8 < bit_depth <= 16:
+        dtype = np.dtype("<u2")
+    else:
+        raise ValueError(f"Unsupported bit depth: {bit_depth}")
+        
+    try:
+        array = np.frombuffer(image_data, dtype=dtype)
+        if width is None or height is None:
+            return array
+        if channels > 1:
+            return array.reshape(height, width, channels)
+        return array.reshape(height, width)
+    except (TypeError, ValueError) as e:
+        logger.error("Error converting image data: %s", e)
+        return None
 
 
-def save_image(image_data: Any, file_path: str, format: str = "jpeg") -> bool:
+def save_image(image_data: Any, file_path: str, format: str = "jpeg", quality: int = 95) -> bool:
     """Save image data to a file.
     
     Args:
-        image_data: Image data from EDSDK
+        image_data: Image data from EDSDK, either encoded bytes or a uint8
+            NumPy array in RGB or RGBA channel order. Deeper arrays (e.g.
+            16-bit RAW data) must be scaled to 8 bits before saving as JPEG.
         file_path: Path to save the image
         format: Image format (jpeg, png, etc.)
+        quality: JPEG quality (0-100) used when encoding NumPy images
         
     Returns:
         True if successful, False otherwise
     """
     try:
+        if isinstance(image_data, (bytes, bytearray, memoryview)):
+            # Already encoded in the target format - write it out as-is
+            signature = _FORMAT_SIGNATURES.get(format.lower())
+            if signature and bytes(image_data[:len(signature)]) == signature:
+                with open(file_path, "wb") as f:
+                    f.write(image_data)
+                return True
+
+        if (HAVE_NUMPY and HAVE_OPENCV and isinstance(image_data, np.ndarray)
+                and format.lower() in ("jpeg", "jpg")):
+            # OpenCV would saturate anything deeper than 8 bits, so refuse
+            # rather than write a clipped image
+            if image_data.dtype != np.uint8:
+                logger.error("JPEG output requires uint8 image data, got %s", image_data.dtype)
+                return False
+                
+            # Encode in memory with OpenCV and write the raw JPEG bytes
+            if image_data.ndim == 3 and image_data.shape[2] == 3:
+                image_data = cv2.cvtColor(image_data, cv2.COLOR_RGB2BGR)
+            elif image_data.ndim == 3 and image_data.shape[2] == 4:
+                # JPEG has no alpha channel, so drop it while reordering
+                image_data = cv2.cvtColor(image_data, cv2.COLOR_RGBA2BGR)
+            ok, buf = cv2.imencode(".jpg", image_data, [int(cv2.IMWRITE_JPEG_QUALITY), quality])
+            if not ok:
+                logger.error("Error encoding image as JPEG")
+                return False
+            with open(file_path, "wb") as f:
+                f.write(buf)
+            return True
+
         # This would be implemented to save EDSDK image data to a file
         return True
     except Exception as e:
-        logger.error(f"Error saving image: {e}")
+        logger.error("Error saving image: %s", e)
         return False
 
 
@@ -68,37 +166,200 @@ def get_thumbnail(image_data: Any) -> Optional[Any]:
     return None
 
 
-def resize_image(image_data: Any, width: int, height: int) -> Optional[Any]:
+def resize_image(image_data: Any, width: int, height: int,
+                 interpolation: Optional[int] = None) -> Optional[Any]:
     """Resize image data.
     
     Args:
-        image_data: Image data from EDSDK
+        image_data: Image data as a NumPy array
         width: Target width
         height: Target height
+        interpolation: OpenCV interpolation flag. By default cv2.INTER_AREA
+            is used for downscales of 2x or more and cv2.INTER_LINEAR
+            otherwise; live view previews should pass cv2.INTER_LINEAR.
+            Without OpenCV, PIL is used with the matching filter, defaulting
+            to bilinear.
         
     Returns:
-        Resized image data, or None if resizing failed
+        Resized image data, or None if resizing failed (e.g. unsupported
+        input type or dtype)
+        
+    Raises:
+        ValueError: If width or height is not positive
     """
     if not HAVE_NUMPY:
         logger.warning("NumPy not available. Cannot resize image.")
         return None
         
-    # This would be implemented to resize EDSDK image data
-    return None
+    if width <= 0 or height <= 0:
+        raise ValueError("Width and height must be positive")
+        
+    try:
+        if not HAVE_OPENCV:
+            if not HAVE_PIL or image_data.dtype != np.uint8:
+                logger.warning("OpenCV not available. Cannot resize image.")
+                return None
+            resample = _PIL_RESAMPLING.get(interpolation, Image.BILINEAR)
+            resized = Image.fromarray(image_data).resize((width, height), resample)
+            return np.asarray(resized)
+            
+        if interpolation is None:
+            if image_data.shape[1] >= 2 * width and image_data.shape[0] >= 2 * height:
+                interpolation = cv2.INTER_AREA
+            else:
+                interpolation = cv2.INTER_LINEAR
+        elif interpolation == cv2.INTER_LINEAR:
+            # Halve with pyrDown until the remaining downscale is under 2x
+            while image_data.shape[1] >= 2 * width and image_data.shape[0] >= 2 * height:
+                image_data = cv2.pyrDown(image_data)
+                
+        return cv2.resize(image_data, (width, height), interpolation=interpolation)
+    except Exception as e:
+        logger.error("Error resizing image: %s", e)
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _load_parallel_histogram() -> Optional[Any]:
+    """Import the Numba histogram kernel on first use.
+    
+    Returns:
+        The parallel histogram function, or None if Numba cannot be imported
+    """
+    if not HAVE_NUMBA:
+        logger.warning("Numba not available. Using the NumPy histogram.")
+        return None
+    try:
+        from ._numba_histogram import parallel_histogram
+    except ImportError as e:
+        # e.g. a Numba build that does not support the installed NumPy
+        logger.warning("Could not import Numba (%s). Using the NumPy histogram.", e)
+        return None
+    return parallel_histogram
 
 
-def apply_histogram_stretching(image_data: Any) -> Optional[Any]:
+def _compute_histogram(image_data: Any, levels: int, use_numba: bool = False) -> Any:
+    """Count pixel values, optionally with a parallel Numba kernel.
+    
+    Args:
+        image_data: Integer image as a NumPy array
+        levels: Number of possible pixel values
+        use_numba: Use the parallel Numba kernel for large images. The first
+            call per dtype pays the JIT compile unless a disk cache exists.
+        
+    Returns:
+        Histogram with one bin per possible pixel value
+    """
+    values = image_data.ravel()
+    if use_numba and values.size >= _PARALLEL_HISTOGRAM_MIN_PIXELS:
+        parallel_histogram = _load_parallel_histogram()
+        if parallel_histogram is not None:
+            return parallel_histogram(values, levels)
+    return np.bincount(values, minlength=levels)
+
+
+def _build_linear_lut(hist: Any, low_percentile: float, high_percentile: float) -> Optional[Any]:
+    """Build a lookup table that linearly stretches a percentile range.
+    
+    Args:
+        hist: Histogram with one bin per possible pixel value
+        low_percentile: Percentile mapped to black
+        high_percentile: Percentile mapped to full scale
+        
+    Returns:
+        Float32 lookup table with one entry per bin, or None if the
+        histogram has no spread to stretch
+    """
+    cdf = np.cumsum(hist)
+    total = cdf[-1]
+    lo = int(np.searchsorted(cdf, total * low_percentile / 100.0))
+    hi = int(np.searchsorted(cdf, total * high_percentile / 100.0))
+    if hi <= lo:
+        return None
+        
+    max_value = len(hist) - 1
+    lut = (np.arange(len(hist), dtype=np.float32) - lo) * (max_value / (hi - lo))
+    return np.clip(lut, 0, max_value)
+
+
+def _build_arcsinh_lut(hist: Any) -> Optional[Any]:
+    """Build a lookup table for an ArcSinH stretch around the median.
+    
+    The median is mapped to a small base level and the maximum to full
+    scale, with an inverse hyperbolic sine curve in between.
+    
+    Args:
+        hist: Histogram with one bin per possible pixel value
+        
+    Returns:
+        Float32 lookup table with one entry per bin, or None if the
+        histogram has no spread to stretch
+    """
+    cdf = np.cumsum(hist)
+    median = int(np.searchsorted(cdf, cdf[-1] / 2.0))
+    maximum = int(np.flatnonzero(hist)[-1]) if cdf[-1] else 0
+    if maximum <= median:
+        return None
+        
+    levels = len(hist)
+    base = _ARCSINH_BASE * levels / 256.0
+    span = levels - base
+    scale = span / (maximum - median)
+    damper = span / np.arcsinh(span * _ARCSINH_POWER)
+    
+    x = np.arange(levels, dtype=np.float32)
+    lut = np.arcsinh((x - median) * (scale * _ARCSINH_POWER)) * damper + base
+    return np.clip(lut, 0, levels - 1)
+
+
+def apply_histogram_stretching(image_data: Any, method: str = "linear",
+                               low_percentile: float = 0.5,
+                               high_percentile: float = 99.5,
+                               use_numba: bool = False) -> Optional[Any]:
     """Apply histogram stretching to improve image contrast.
     
+    The stretch is computed once as a lookup table over all possible pixel
+    values and then applied in a single pass over the image.
+    
     Args:
-        image_data: Image data from EDSDK
+        image_data: 8-bit or 16-bit image as a NumPy array
+        method: "linear" for a percentile stretch, or "arcsinh" for a
+            non-linear stretch that lifts faint detail
+        low_percentile: Percentile of pixel values mapped to black (linear only)
+        high_percentile: Percentile of pixel values mapped to full scale (linear only)
+        use_numba: Compute the histogram of large images with a parallel
+            Numba kernel. Off by default because the first call compiles it.
         
     Returns:
         Processed image data, or None if processing failed
+        
+    Raises:
+        ValueError: If method is not recognized
     """
+    if method not in ("linear", "arcsinh"):
+        raise ValueError(f"Unknown histogram stretching method: {method}")
+        
     if not HAVE_NUMPY:
         logger.warning("NumPy not available. Cannot process image.")
         return None
         
-    # This would be implemented to apply histogram stretching
-    return None 
\ No newline at end of file
+    if image_data.dtype == np.uint8:
+        levels = 256
+    elif image_data.dtype == np.uint16:
+        levels = 65536
+    else:
+        logger.warning("Unsupported image dtype for histogram stretching: %s", image_data.dtype)
+        return None
+        
+    hist = _compute_histogram(image_data, levels, use_numba)
+    if method == "arcsinh":
+        lut = _build_arcsinh_lut(hist)
+    else:
+        lut = _build_linear_lut(hist, low_percentile, high_percentile)
+    if lut is None:
+        return image_data.copy()
+    lut = lut.astype(image_data.dtype)
+    
+    if levels == 256 and HAVE_OPENCV:
+        return cv2.LUT(image_data, lut)
+    return np.take(lut, image_data) 
\ No newline at end of file
@@ -7,6 +7,9 @@ This example shows how to start live view, download frames, and adjust focus.
 import os
 import sys
 import time
+import queue
+import struct
+import threading
 import logging
 from pathlib import Path
 
@@ -33,6 +36,36 @@ except ImportError:
 logger = setup_logger(level=logging.INFO)
 
 
+# Header for records in the frames.bin stream: frame number, payload length
+_FRAME_HDR = struct.Struct("<II")
+
+# Gradient templates keyed by (height, width); they never change between frames
+_GRADIENT_CACHE = {}
+
+# Output buffers keyed by (height, width), reused across frames
+_SCRATCH = {}
+
+
+def _build_gradient(height, width):
+    """Build a gradient image from top-left to bottom-right.
+    
+    Args:
+        height: Image height in pixels
+        width: Image width in pixels
+        
+    Returns:
+        BGR gradient image
+    """
+    img = np.empty((height, width, 3), dtype=np.uint8)
+    # Broadcast integer ramps instead of a per-pixel Python loop
+    ys = np.arange(height, dtype=np.uint32)[:, None]
+    xs = np.arange(width, dtype=np.uint32)[None, :]
+    img[..., 0] = 255 * ys // height
+    img[..., 1] = 255 * xs // width
+    img[..., 2] = 255 * (xs + ys) // (width + height)
+    return img
+
+
 def convert_frame_to_cv2(frame_data):
     """Convert the EDSDK frame data to an OpenCV image.
     
@@ -43,25 +76,42 @@ def convert_frame_to_cv2(frame_data):
         frame_data: Raw frame data from the camera
         
     Returns:
-        OpenCV-compatible image or None if conversion fails
+        OpenCV-compatible image or None if conversion fails. The image is
+        overwritten by the next call, so copy it if it must be kept.
     """
     # This is a mock implementation - in reality, you'd convert the actual data
     # For this example, we'll create a simple gradient image
     if HAVE_OPENCV:
         height, width = 480, 640
-        img = np.zeros((height, width, 3), dtype=np.uint8)
-        # Create a gradient from top-left to bottom-right
-        for y in range(height):
-            for x in range(width):
-                img[y, x] = [
-                    int(255 * y / height),
-                    int(255 * x / width),
-                    int(255 * (x + y) / (width + height))
-                ]
-        return img
+        template = _GRADIENT_CACHE.get((height, width))
+        if template is None:
+            template = _build_gradient(height, width)
+            _GRADIENT_CACHE[(height, width)] = template
+        # Callers draw on the returned image, so refresh the scratch buffer
+        # from the template instead of allocating a new image every frame
+        buf = _SCRATCH.get((height, width))
+        if buf is None:
+            buf = np.empty_like(template)
+            _SCRATCH[(height, width)] = buf
+        np.copyto(buf, template)
+        return buf
     return None
 
 
+def _frame_writer(frame_queue):
+    """Write queued frames to disk until a None sentinel is received.
+    
+    Args:
+        frame_queue: Queue of (path, image) pairs
+    """
+    while True:
+        item = frame_queue.get()
+        if item is None:
+            break
+        frame_path, img = item
+        cv2.imwrite(frame_path, img)
+
+
 def main():
     """Main function demonstrating live view functionality."""
     print("Canon Camera Live View Example")
@@ -102,53 +152,107 @@ def main():
             
             frame_count = 0
             max_frames = 100  # Limit frames for the example
+            frame_period = 1.0 / 30  # Target display rate when frames arrive faster
             
-            while frame_count < max_frames:
-                # In a real implementation, this would be:
-                # frame_data = camera.download_live_view_frame()
+            # Without OpenCV, append placeholder frames to a single stream
+            # instead of creating a file per frame. Each record is a
+            # _FRAME_HDR header followed by the payload.
+            frames_file = None
+            if not HAVE_OPENCV:
+                frames_path = os.path.join(save_dir, "frames.bin")
+                frames_file = open(frames_path, 'wb')
+            else:
+                # Encode and write JPEGs on a background thread so disk I/O
+                # does not stall the display loop
+                writer_queue = queue.Queue(maxsize=8)
+                writer_thread = threading.Thread(target=_frame_writer, args=(writer_queue,), daemon=True)
+                writer_thread.start()
                 
-                # For demonstration, we'll use our mock function
-                frame_data = f"dummy_frame_data_{frame_count}"  # Placeholder
-                
-                # Convert and display frame if OpenCV is available
-                if HAVE_OPENCV:
-                    # Convert frame to OpenCV format
-                    img = convert_frame_to_cv2(frame_data)
-                    
-                    # Add some information to the frame
-                    font = cv2.FONT_HERSHEY_SIMPLEX
-                    cv2.putText(img, f"Frame: {frame_count}", (20, 30), font, 0.7, (255, 255, 255), 2)
-                    cv2.putText(img, "Press 'q' to quit", (20, 60), font, 0.7, (255, 255, 255), 2)
+                # pollKey() needs OpenCV >= 4.5; older versions fall back to a 1 ms waitKey()
+                poll_key = getattr(cv2, "pollKey", None)
+            
+            # Frame file names only differ by number, so build the path once
+            frame_path_fmt = os.path.join(save_dir, "frame_{:04d}.jpg")
+            
+            # Static overlay text is rasterized once and reused every frame;
+            # only its bounding box is blended in
+            static_overlay = None
+            overlay_roi = None
+            
+            try:
+                while frame_count < max_frames:
+                    frame_start = time.perf_counter()
                     
-                    # Save frame
-                    frame_path = os.path.join(save_dir, f"frame_{frame_count:04d}.jpg")
-                    cv2.imwrite(frame_path, img)
+                    # In a real implementation, this would be:
+                    # frame_data = camera.download_live_view_frame()
                     
-                    # Display frame
-                    cv2.imshow("Canon Live View", img)
+                    # For demonstration, we'll use our mock function
+                    frame_data = f"dummy_frame_data_{frame_count}"  # Placeholder
                     
-                    # Wait for keyboard input
-                    key = cv2.waitKey(100)  # Wait 100ms
+                    # Convert and display frame if OpenCV is available
+                    if HAVE_OPENCV:
+                        # Convert frame to OpenCV format
+                        img = convert_frame_to_cv2(frame_data)
+                        
+                        # Add some information to the frame
+                        font = cv2.FONT_HERSHEY_SIMPLEX
+                        if static_overlay is None:
+                            text, org, scale, thickness = "Press 'q' to quit", (20, 60), 0.7, 2
+                            (text_w, text_h), baseline = cv2.getTextSize(text, font, scale, thickness)
+                            overlay_roi = (slice(max(org[1] - text_h - thickness, 0), org[1] + baseline + thickness),
+                                           slice(max(org[0] - thickness, 0), org[0] + text_w + thickness))
+                            overlay = np.zeros_like(img)
+                            cv2.putText(overlay, text, org, font, scale, (255, 255, 255), thickness)
+                            static_overlay = overlay[overlay_roi].copy()
+                        roi = img[overlay_roi]
+                        np.maximum(roi, static_overlay, out=roi)
+                        cv2.putText(img, f"Frame: {frame_count}", (20, 30), font, 0.7, (255, 255, 255), 2)
+                        
+                        # Save frame, dropping it if the writer has fallen behind
+                        frame_path = frame_path_fmt.format(frame_count)
+                        try:
+                            writer_queue.put_nowait((frame_path, img.copy()))
+                        except queue.Full:
+                            logger.warning("Writer busy, dropped frame %d", frame_count)
+                        
+                        # Display frame
+                        cv2.imshow("Canon Live View", img)
+                        
+                        # Check for keyboard input without blocking, then sleep
+                        # only for what is left of the frame period
+                        key = poll_key() if poll_key is not None else cv2.waitKey(1)
+                        remaining = frame_period - (time.perf_counter() - frame_start)
+                        if remaining > 0:
+                            time.sleep(remaining)
+                        
+                        if key == ord('q'):  # Quit
+                            print("Quitting...")
+                            break
+                        elif key == ord('f'):  # Focus near
+                            print("Focusing near...")
+                            # camera.focus_near()
+                        elif key == ord('j'):  # Focus far
+                            print("Focusing far...")
+                            # camera.focus_far()
+                    else:
+                        # Without OpenCV, just save placeholder frame and wait
+                        payload = f"Placeholder for frame {frame_count}".encode()
+                        frames_file.write(_FRAME_HDR.pack(frame_count, len(payload)) + payload)
+                        
+                        print(f"Frame {frame_count} saved to {frames_path}")
+                        time.sleep(0.1)  # Wait a bit before next frame
                     
-                    if key == ord('q'):  # Quit
-                        print("Quitting...")
-                        break
-                    elif key == ord('f'):  # Focus near
-                        print("Focusing near...")
-                        # camera.focus_near()
-                    elif key == ord('j'):  # Focus far
-                        print("Focusing far...")
-                        # camera.focus_far()
+                    frame_count += 1
+            finally:
+                # Runs even if the loop fails, so no frames are lost
+                if HAVE_OPENCV:
+                    # Let the writer finish the frames still queued; it is a
+                    # daemon thread, so anything left at exit would be dropped
+                    writer_queue.put(None)
+                    writer_thread.join()
                 else:
-                    # Without OpenCV, just save placeholder frame and wait
-                    frame_path = os.path.join(save_dir, f"frame_{frame_count:04d}.txt")
-                    with open(frame_path, 'w') as f:
-                        f.write(f"Placeholder for frame {frame_count}")
-                    
-                    print(f"Frame {frame_count} saved to {frame_path}")
-                    time.sleep(0.1)  # Wait a bit before next frame
-                
-                frame_count += 1
+                    # Closing also flushes any buffered records
+                    frames_file.close()
             
             # Stop live view
             print("\nStopping live view...")
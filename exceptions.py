@@ -11,6 +11,23 @@ except ImportError:
     edsdk_bindings = None
 
 
+# EDSDK error codes mapped to exception classes, filled in by _register
+_ERROR_CLASS_MAP: Dict[int, type] = {}
+
+
+def _register(error_name: str):
+    """Class decorator that maps an EDSDK error code to an exception class.
+    
+    Args:
+        error_name: Name of the EdsError member raised as the decorated class
+    """
+    def decorator(cls):
+        if edsdk_bindings:
+            _ERROR_CLASS_MAP[getattr(edsdk_bindings.EdsError, error_name)] = cls
+        return cls
+    return decorator
+
+
 class CanonError(Exception):
     """Base exception for all Canon camera errors."""
     
@@ -40,20 +57,7 @@ class CanonError(Exception):
         if not edsdk_bindings:
             return cls(f"EDSDK error code: {error_code}", error_code)
             
-        # Map EDSDK error codes to specific exception classes
-        error_map = {
-            edsdk_bindings.EdsError.DEVICE_NOT_FOUND: DeviceNotFoundError,
-            edsdk_bindings.EdsError.DEVICE_BUSY: DeviceBusyError,
-            edsdk_bindings.EdsError.SESSION_NOT_OPEN: SessionNotOpenError,
-            edsdk_bindings.EdsError.COMMUNICATION_ERROR: CommunicationError,
-            edsdk_bindings.EdsError.FILE_IO_ERROR: FileIOError,
-            edsdk_bindings.EdsError.INTERNAL_ERROR: InternalError,
-            edsdk_bindings.EdsError.MEM_ALLOC_FAILED: MemoryError,
-            edsdk_bindings.EdsError.NOT_SUPPORTED: NotSupportedError,
-            edsdk_bindings.EdsError.OPERATION_CANCELLED: OperationCancelledError,
-        }
-        
-        exception_class = error_map.get(error_code, cls)
+        exception_class = _ERROR_CLASS_MAP.get(error_code, cls)
         
         # Use a default message based on error code if none provided
         if message is None:
@@ -74,68 +78,58 @@ class CanonError(Exception):
         if not edsdk_bindings:
             return f"EDSDK error code: {error_code}"
             
-        error_messages = {
-            edsdk_bindings.EdsError.OK: "No error",
-            edsdk_bindings.EdsError.UNIMPLEMENTED: "Not implemented",
-            edsdk_bindings.EdsError.INTERNAL_ERROR: "Internal error",
-            edsdk_bindings.EdsError.MEM_ALLOC_FAILED: "Memory allocation failed",
-            edsdk_bindings.EdsError.MEM_FREE_FAILED: "Memory free failed",
-            edsdk_bindings.EdsError.OPERATION_CANCELLED: "Operation cancelled",
-            edsdk_bindings.EdsError.INCOMPATIBLE_VERSION: "Incompatible version",
-            edsdk_bindings.EdsError.NOT_SUPPORTED: "Operation not supported",
-            edsdk_bindings.EdsError.UNEXPECTED_EXCEPTION: "Unexpected exception occurred",
-            edsdk_bindings.EdsError.PROTECTION_VIOLATION: "Protection violation",
-            edsdk_bindings.EdsError.FILE_IO_ERROR: "File I/O error",
-            edsdk_bindings.EdsError.DEVICE_NOT_FOUND: "Device not found",
-            edsdk_bindings.EdsError.DEVICE_BUSY: "Device busy",
-            edsdk_bindings.EdsError.DEVICE_INVALID: "Invalid device",
-            edsdk_bindings.EdsError.COMMUNICATION_ERROR: "Communication error",
-            edsdk_bindings.EdsError.SESSION_NOT_OPEN: "Session not open",
-        }
-        
-        return error_messages.get(error_code, f"Unknown error code: {error_code}")
+        return _ERROR_MESSAGES.get(error_code, f"Unknown error code: {error_code}")
 
 
+@_register("DEVICE_NOT_FOUND")
 class DeviceNotFoundError(CanonError):
     """Raised when a camera device is not found."""
     pass
 
 
+@_register("DEVICE_BUSY")
 class DeviceBusyError(CanonError):
     """Raised when the camera device is busy."""
     pass
 
 
+@_register("SESSION_NOT_OPEN")
 class SessionNotOpenError(CanonError):
     """Raised when an operation is attempted but no session is open."""
     pass
 
 
+@_register("COMMUNICATION_ERROR")
 class CommunicationError(CanonError):
     """Raised when there is an error communicating with the camera."""
     pass
 
 
+@_register("NOT_SUPPORTED")
 class NotSupportedError(CanonError):
     """Raised when an operation is not supported by the camera."""
     pass
 
 
+@_register("OPERATION_CANCELLED")
 class OperationCancelledError(CanonError):
     """Raised when an operation is cancelled."""
     pass
 
 
+@_register("FILE_IO_ERROR")
 class FileIOError(CanonError):
     """Raised when there is an error with file I/O operations."""
     pass
 
 
+@_register("MEM_ALLOC_FAILED")
 class MemoryError(CanonError):
     """Raised when there is a memory allocation error."""
     pass
 
 
+@_register("INTERNAL_ERROR")
 class InternalError(CanonError):
     """Raised when there is an internal EDSDK error."""
     pass
@@ -151,4 +145,28 @@ class CameraNotInitializedError(CanonError):
     
     def __init__(self, message: str = None):
         """Initialize with a default message if none provided."""
-        super().__init__(message or "Camera not initialized. Call connect_to_camera() first.") 
\ No newline at end of file
+        super().__init__(message or "Camera not initialized. Call connect_to_camera() first.")
+
+
+# Human-readable messages for EDSDK error codes, built once at import time
+if edsdk_bindings:
+    _ERROR_MESSAGES = {
+        edsdk_bindings.EdsError.OK: "No error",
+        edsdk_bindings.EdsError.UNIMPLEMENTED: "Not implemented",
+        edsdk_bindings.EdsError.INTERNAL_ERROR: "Internal error",
+        edsdk_bindings.EdsError.MEM_ALLOC_FAILED: "Memory allocation failed",
+        edsdk_bindings.EdsError.MEM_FREE_FAILED: "Memory free failed",
+        edsdk_bindings.EdsError.OPERATION_CANCELLED: "Operation cancelled",
+        edsdk_bindings.EdsError.INCOMPATIBLE_VERSION: "Incompatible version",
+        edsdk_bindings.EdsError.NOT_SUPPORTED: "Operation not supported",
+        edsdk_bindings.EdsError.UNEXPECTED_EXCEPTION: "Unexpected exception occurred",
+        edsdk_bindings.EdsError.PROTECTION_VIOLATION: "Protection violation",
+        edsdk_bindings.EdsError.FILE_IO_ERROR: "File I/O error",
+        edsdk_bindings.EdsError.DEVICE_NOT_FOUND: "Device not found",
+        edsdk_bindings.EdsError.DEVICE_BUSY: "Device busy",
+        edsdk_bindings.EdsError.DEVICE_INVALID: "Invalid device",
+        edsdk_bindings.EdsError.COMMUNICATION_ERROR: "Communication error",
+        edsdk_bindings.EdsError.SESSION_NOT_OPEN: "Session not open",
+    }
+else:
+    _ERROR_MESSAGES = {}
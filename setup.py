@@ -1,19 +1,58 @@
 import os
 import re
+import glob
+import hashlib
 import sys
 import platform
+import shutil
+import sysconfig
 import subprocess
 from setuptools import setup, Extension, find_packages
 from setuptools.command.build_ext import build_ext
 from pathlib import Path
 
-# Get version from __init__.py
-with open('__init__.py', 'r') as f:
-    version_match = re.search(r"^__version__ = ['\"]([^'\"]*)['\"]", f.read(), re.M)
+# Directory containing this setup.py
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+# Matches the __version__ assignment in __init__.py
+_VERSION_RE = re.compile(r"^__version__\s*=\s*['\"]([^'\"]+)['\"]", re.M)
+
+
+def _get_version():
+    """Read the package version from __init__.py."""
+    with open(os.path.join(_HERE, '__init__.py'), 'r', encoding='utf-8') as f:
+        # The assignment sits near the top, so only read the rest if needed
+        head = f.read(4096)
+        version_match = _VERSION_RE.search(head) or _VERSION_RE.search(head + f.read())
     if version_match:
-        version = version_match.group(1)
-    else:
-        version = '0.1.0'  # Default version if not found
+        return version_match.group(1)
+    return '0.1.0'  # Default version if not found
+
+
+def _get_readme():
+    """Read the long description from README.md."""
+    with open(os.path.join(_HERE, 'README.md'), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+# CMake inputs of the bindings, relative to the extension source dir. Only
+# these are scanned so unrelated trees (virtualenvs, build output) are skipped.
+_NATIVE_SOURCE_FILES = ('CMakeLists.txt', 'bindings.cpp')
+_NATIVE_SOURCE_DIRS = ('edsdk', os.path.join('lib', '*', 'include'))
+_NATIVE_SOURCE_EXTENSIONS = ('.cpp', '.cc', '.c', '.h', '.hpp', '.cmake')
+
+
+def _newest_source_mtime(sourcedir):
+    """Return the newest modification time of the CMake inputs under sourcedir."""
+    newest = max(os.path.getmtime(os.path.join(sourcedir, name)) for name in _NATIVE_SOURCE_FILES)
+    for pattern in _NATIVE_SOURCE_DIRS:
+        for top in glob.glob(os.path.join(sourcedir, pattern)):
+            for root, dirs, files in os.walk(top):
+                for name in files:
+                    if name.endswith(_NATIVE_SOURCE_EXTENSIONS):
+                        newest = max(newest, os.path.getmtime(os.path.join(root, name)))
+    return newest
 
 
 # A CMakeExtension class to handle CMake build
@@ -35,7 +74,20 @@ class CMakeBuild(build_ext):
             self.build_extension(ext)
 
     def build_extension(self, ext):
-        extdir = os.path.abspath(os.path.dirname(self.get_ext_fullpath(ext.name)))
+        ext_path = self.get_ext_fullpath(ext.name)
+        extdir = os.path.abspath(os.path.dirname(ext_path))
+        # Have CMake write the file name setuptools expects, e.g.
+        # edsdk_bindings.cpython-311-x86_64-linux-gnu.so, not libedsdk_bindings.so
+        ext_suffix = os.path.basename(ext_path)[len(ext.name.split('.')[-1]):]
+        
+        # Prefer Ninja when it is installed and no generator was picked via CMAKE_GENERATOR
+        use_ninja = 'CMAKE_GENERATOR' not in os.environ and shutil.which('ninja') is not None
+        if use_ninja and platform.system() == "Windows":
+            # Unlike the Visual Studio generator, Ninja does not locate MSVC itself,
+            # so only use it from a developer shell targeting this Python's architecture
+            target_arch = 'x64' if sys.maxsize > 2**32 else 'x86'
+            use_ninja = ('VCINSTALLDIR' in os.environ
+                         and os.environ.get('VSCMD_ARG_TGT_ARCH', '').lower() == target_arch)
         
         # Required for Windows
         if platform.system() == "Windows":
@@ -43,20 +95,24 @@ class CMakeBuild(build_ext):
             
             # Determine architecture and set appropriate EDSDK path
             if sys.maxsize > 2**32:
-                cmake_args += ['-A', 'x64']
+                if not use_ninja:
+                    # Architecture flag only applies to Visual Studio generators
+                    cmake_args += ['-A', 'x64']
                 # Use 64-bit EDSDK
-                edsdk_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lib', 'EDSDK_64')
+                edsdk_path = os.path.join(_HERE, 'lib', 'EDSDK_64')
             else:
                 # Use 32-bit EDSDK
-                edsdk_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lib', 'EDSDK')
+                edsdk_path = os.path.join(_HERE, 'lib', 'EDSDK')
                 
             # Add EDSDK path to CMake arguments
             cmake_args += [f'-DEDSDK_PATH={edsdk_path}']
         else:
             cmake_args = [f'-DCMAKE_LIBRARY_OUTPUT_DIRECTORY={extdir}']
             # Add lib/EDSDK path for non-Windows platforms
-            edsdk_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lib', 'EDSDK')
+            edsdk_path = os.path.join(_HERE, 'lib', 'EDSDK')
             cmake_args += [f'-DEDSDK_PATH={edsdk_path}']
+        # Build against the interpreter running setup.py so the ABI and suffix match
+        cmake_args += [f'-DEDSDK_BINDINGS_SUFFIX={ext_suffix}', f'-DPYTHON_EXECUTABLE={sys.executable}']
 
         # Set build type
         cfg = 'Debug' if self.debug else 'Release'
@@ -65,34 +121,69 @@ class CMakeBuild(build_ext):
         # Configure platform-specific build options
         if platform.system() == "Windows":
             cmake_args += [f'-DCMAKE_LIBRARY_OUTPUT_DIRECTORY_{cfg.upper()}={extdir}']
-            build_args += ['--', '/m']
-        else:
+        if use_ninja:
+            cmake_args = ['-G', 'Ninja'] + cmake_args
+        if use_ninja or platform.system() != "Windows":
+            # Single-config generators take the build type at configure time
             cmake_args += [f'-DCMAKE_BUILD_TYPE={cfg}']
-            build_args += ['--', '-j2']
+
+        # Build with every core unless CMAKE_BUILD_PARALLEL_LEVEL says otherwise
+        if 'CMAKE_BUILD_PARALLEL_LEVEL' not in os.environ:
+            build_args += ['--parallel', str(os.cpu_count() or 2)]
+
+        # Reuse cached object files across rebuilds when a compiler cache is installed
+        launchers = ['sccache', 'ccache'] if platform.system() == "Windows" else ['ccache', 'sccache']
+        launcher = next((name for name in launchers if shutil.which(name)), None)
+        if launcher:
+            cmake_args += [f'-DCMAKE_CXX_COMPILER_LAUNCHER={launcher}',
+                           f'-DCMAKE_C_COMPILER_LAUNCHER={launcher}']
 
         env = os.environ.copy()
         env['CXXFLAGS'] = f'{env.get("CXXFLAGS", "")} -DVERSION_INFO=\\"{self.distribution.get_version()}\\"'
         
-        # Build directory
-        build_dir = os.path.join(self.build_temp, ext.name)
-        if not os.path.exists(build_dir):
-            os.makedirs(build_dir)
+        # Build directory. It lives in the source tree rather than under
+        # build_temp so the CMake cache and object files survive between
+        # installs; the platform tag keeps builds for different interpreters apart.
+        # A CMake cache cannot switch generators, so Ninja builds get their own tree.
+        plat_tag = f'{sysconfig.get_platform()}-{sys.implementation.cache_tag}'
+        if use_ninja:
+            plat_tag += '-ninja'
+        build_dir = os.path.join(_HERE, 'build', f'cmake.{plat_tag}', ext.name)
+        os.makedirs(build_dir, exist_ok=True)
 
-        # Run CMake
-        subprocess.check_call(['cmake', ext.sourcedir] + cmake_args, cwd=build_dir, env=env)
+        # Run CMake, configuring only when the cache is missing or the inputs changed
+        config_hash = hashlib.sha256(
+            '\0'.join([ext.sourcedir, env['CXXFLAGS']] + sorted(cmake_args)).encode()
+        ).hexdigest()
+        hash_path = os.path.join(build_dir, '.cmake_args_hash')
+        try:
+            with open(hash_path, 'r') as f:
+                configured = f.read().strip() == config_hash
+        except OSError:
+            configured = False
+        has_cache = os.path.exists(os.path.join(build_dir, 'CMakeCache.txt'))
+        
+        # Nothing to do if the extension was built with these arguments and no
+        # native source changed since; set FORCE_REBUILD=1 to build anyway
+        if (configured and has_cache and not os.environ.get('FORCE_REBUILD')
+                and os.path.exists(ext_path)
+                and os.path.getmtime(ext_path) >= _newest_source_mtime(ext.sourcedir)):
+            return
+        
+        if not configured or not has_cache:
+            subprocess.check_call(['cmake', ext.sourcedir] + cmake_args, cwd=build_dir, env=env)
+            with open(hash_path, 'w') as f:
+                f.write(config_hash)
         subprocess.check_call(['cmake', '--build', '.'] + build_args, cwd=build_dir)
 
 
-with open('README.md', 'r', encoding='utf-8') as f:
-    long_description = f.read()
-
 setup(
     name='cannon_wrapper',
-    version=version,
+    version=_get_version(),
     author='Canon EDSDK Team',
     author_email='info@example.com',
     description='Python wrapper for Canon EDSDK',
-    long_description=long_description,
+    long_description=_get_readme(),
     long_description_content_type='text/markdown',
     url='https://github.com/username/cannon_wrapper',
     packages=find_packages(),
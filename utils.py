@@ -3,9 +3,12 @@ Utility functions for the Canon EDSDK Python wrapper.
 """
 
 import os
+import re
 import platform
 import ctypes
 import logging
+import datetime
+import functools
 from typing import List, Dict, Any, Optional, Tuple, Union, Callable
 
 try:
@@ -20,10 +23,24 @@ except ImportError:
 # Configure logger
 logger = logging.getLogger("cannon_wrapper")
 
+# Handlers installed by setup_logger(), replaced on each call
+_logger_handlers: List[logging.Handler] = []
+
+# Characters removed from camera names used in directory names
+_INVALID_DIR_CHARS = re.compile(r'[^\w\- ]')
+
+# Directory containing this package
+_PKG_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# EDSDK library handle, loaded once by load_edsdk_library()
+_edsdk_library = None
+
 
 def setup_logger(level: int = logging.INFO, log_file: Optional[str] = None) -> logging.Logger:
     """Set up the logger for the Canon wrapper.
     
+    Calling this again replaces the handlers added by the previous call.
+    
     Args:
         level: Logging level (e.g., logging.INFO, logging.DEBUG)
         log_file: Optional path to a log file
@@ -33,6 +50,12 @@ def setup_logger(level: int = logging.INFO, log_file: Optional[str] = None) -> l
     """
     logger.setLevel(level)
     
+    # Drop handlers from a previous call so repeated setup does not duplicate output
+    for handler in _logger_handlers:
+        logger.removeHandler(handler)
+        handler.close()
+    _logger_handlers.clear()
+    
     # Create console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(level)
@@ -43,6 +66,7 @@ def setup_logger(level: int = logging.INFO, log_file: Optional[str] = None) -> l
     
     # Add console handler to logger
     logger.addHandler(console_handler)
+    _logger_handlers.append(console_handler)
     
     # Add file handler if log_file is specified
     if log_file:
@@ -50,6 +74,7 @@ def setup_logger(level: int = logging.INFO, log_file: Optional[str] = None) -> l
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)
+        _logger_handlers.append(file_handler)
     
     return logger
 
@@ -64,17 +89,20 @@ def check_errors(error_code: int, operation_name: str = "operation") -> None:
     Raises:
         CanonError: If the error code indicates an error
     """
-    if not edsdk_bindings:
-        if error_code != 0:  # Assume 0 is success
-            raise CanonError(f"Error performing {operation_name}: code {error_code}")
+    # EDS_ERR_OK is 0; skip the enum lookup on the common success path
+    if error_code == 0:
         return
         
+    if not edsdk_bindings:
+        raise CanonError(f"Error performing {operation_name}: code {error_code}")
+        
     if error_code != edsdk_bindings.EdsError.OK:
         raise CanonError.from_edsdk_error(
             error_code, f"Error performing {operation_name}: {CanonError.get_error_message(error_code)}"
         )
 
 
+@functools.lru_cache(maxsize=256)
 def iso_value_to_string(iso_value: int) -> str:
     """Convert ISO numeric value to human-readable string.
     
@@ -90,6 +118,7 @@ def iso_value_to_string(iso_value: int) -> str:
     return edsdk_bindings.Iso.get_label(iso_value)
 
 
+@functools.lru_cache(maxsize=256)
 def aperture_value_to_string(av_value: int) -> str:
     """Convert aperture numeric value to human-readable string.
     
@@ -105,6 +134,7 @@ def aperture_value_to_string(av_value: int) -> str:
     return edsdk_bindings.Av.get_label(av_value)
 
 
+@functools.lru_cache(maxsize=256)
 def shutter_value_to_string(tv_value: int) -> str:
     """Convert shutter speed numeric value to human-readable string.
     
@@ -120,11 +150,13 @@ def shutter_value_to_string(tv_value: int) -> str:
     return edsdk_bindings.Tv.get_label(tv_value)
 
 
+@functools.lru_cache(maxsize=1)
 def find_edsdk_dll() -> Optional[str]:
     """Find the EDSDK DLL/SO/DYLIB path based on the operating system.
     
     Returns:
-        Path to the EDSDK library if found, None otherwise
+        Path to the EDSDK library if found, None otherwise. The search runs
+        once per process; call _reset_edsdk_cache() to repeat it.
     """
     system = platform.system()
     
@@ -132,36 +164,36 @@ def find_edsdk_dll() -> Optional[str]:
     if system == "Windows":
         paths_to_check = [
             # Check new lib directories first
-            os.path.abspath(os.path.join(os.path.dirname(__file__), "lib", "EDSDK")),
-            os.path.abspath(os.path.join(os.path.dirname(__file__), "lib", "EDSDK_64")),
+            os.path.join(_PKG_DIR, "lib", "EDSDK"),
+            os.path.join(_PKG_DIR, "lib", "EDSDK_64"),
             # Default installation paths
             os.path.join(os.environ.get("PROGRAMFILES", "C:\\Program Files"), "Canon", "EOS Utility", "EDSDK"),
             os.path.join(os.environ.get("PROGRAMFILES(X86)", "C:\\Program Files (x86)"), "Canon", "EOS Utility", "EDSDK"),
             # Legacy paths
-            os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "EDSDK")),
-            os.path.abspath(os.path.join(os.path.dirname(__file__), "edsdk")),
+            os.path.join(os.path.dirname(_PKG_DIR), "EDSDK"),
+            os.path.join(_PKG_DIR, "edsdk"),
         ]
         dll_name = "EDSDK.dll"
     elif system == "Darwin":  # macOS
         paths_to_check = [
             # Check new lib directory first
-            os.path.abspath(os.path.join(os.path.dirname(__file__), "lib", "EDSDK.framework")),
+            os.path.join(_PKG_DIR, "lib", "EDSDK.framework"),
             # Default paths
             "/Library/Frameworks/EDSDK.framework",
             os.path.expanduser("~/Library/Frameworks/EDSDK.framework"),
-            os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "EDSDK.framework")),
-            os.path.abspath(os.path.join(os.path.dirname(__file__), "edsdk")),
+            os.path.join(os.path.dirname(_PKG_DIR), "EDSDK.framework"),
+            os.path.join(_PKG_DIR, "edsdk"),
         ]
         dll_name = "EDSDK"
     else:  # Linux
         paths_to_check = [
             # Check new lib directory first
-            os.path.abspath(os.path.join(os.path.dirname(__file__), "lib", "edsdk")),
+            os.path.join(_PKG_DIR, "lib", "edsdk"),
             # Default paths
             "/usr/lib",
             "/usr/local/lib",
-            os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "edsdk")),
-            os.path.abspath(os.path.join(os.path.dirname(__file__), "edsdk")),
+            os.path.join(os.path.dirname(_PKG_DIR), "edsdk"),
+            os.path.join(_PKG_DIR, "edsdk"),
         ]
         dll_name = "libedsdk.so"
     
@@ -170,8 +202,9 @@ def find_edsdk_dll() -> Optional[str]:
         if system == "Darwin" and os.path.isdir(path):  # macOS framework
             return path
         
+        # isfile rather than exists, so a directory named like the library is skipped
         full_path = os.path.join(path, dll_name)
-        if os.path.exists(full_path):
+        if os.path.isfile(full_path):
             return full_path
     
     return None
@@ -180,9 +213,15 @@ def find_edsdk_dll() -> Optional[str]:
 def load_edsdk_library() -> Optional[object]:
     """Attempt to load the EDSDK library using ctypes.
     
+    The library is loaded once and the same handle is returned afterwards.
+    
     Returns:
         Loaded EDSDK library object if successful, None otherwise
     """
+    global _edsdk_library
+    if _edsdk_library is not None:
+        return _edsdk_library
+        
     dll_path = find_edsdk_dll()
     if not dll_path:
         logger.error("EDSDK library not found")
@@ -190,14 +229,25 @@ def load_edsdk_library() -> Optional[object]:
     
     try:
         if platform.system() == "Darwin":  # macOS
-            return ctypes.cdll.LoadLibrary(os.path.join(dll_path, "EDSDK"))
+            _edsdk_library = ctypes.cdll.LoadLibrary(os.path.join(dll_path, "EDSDK"))
         else:
-            return ctypes.cdll.LoadLibrary(dll_path)
+            _edsdk_library = ctypes.cdll.LoadLibrary(dll_path)
+        return _edsdk_library
     except (OSError, ImportError) as e:
-        logger.error(f"Failed to load EDSDK library: {e}")
+        logger.error("Failed to load EDSDK library: %s", e)
         return None
 
 
+def _reset_edsdk_cache() -> None:
+    """Forget the cached EDSDK library location and handle.
+    
+    The next find_edsdk_dll() or load_edsdk_library() call searches again.
+    """
+    global _edsdk_library
+    _edsdk_library = None
+    find_edsdk_dll.cache_clear()
+
+
 def safe_release(eds_object) -> None:
     """Safely release an EDSDK object.
     
@@ -211,7 +261,7 @@ def safe_release(eds_object) -> None:
         if hasattr(eds_object, 'release'):
             eds_object.release()
     except Exception as e:
-        logger.warning(f"Error releasing EDSDK object: {e}")
+        logger.warning("Error releasing EDSDK object: %s", e)
 
 
 def create_save_directory(base_dir: str, camera_name: Optional[str] = None) -> str:
@@ -224,27 +274,40 @@ def create_save_directory(base_dir: str, camera_name: Optional[str] = None) -> s
     Returns:
         Path to the created directory
     """
-    import datetime
-    
-    # Create base directory if it doesn't exist
-    if not os.path.exists(base_dir):
-        os.makedirs(base_dir)
-    
     # Create subdirectory with timestamp and camera name if provided
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
     if camera_name:
         # Remove invalid characters from camera name
-        camera_name = ''.join(c for c in camera_name if c.isalnum() or c in '- _')
+        camera_name = _INVALID_DIR_CHARS.sub('', camera_name)
         subdir_name = f"{timestamp}_{camera_name}"
     else:
         subdir_name = timestamp
     
+    # makedirs also creates base_dir if it doesn't exist
     save_dir = os.path.join(base_dir, subdir_name)
     os.makedirs(save_dir, exist_ok=True)
     
     return save_dir
 
 
+# Valid EDSDK property IDs, collected once at import time
+_property_id_enum = getattr(edsdk_bindings, 'EdsPropertyID', None)
+if hasattr(_property_id_enum, '__members__'):
+    # Enums list their members directly. Keep both the members and their raw
+    # values, since pybind11 enum members only compare equal to members of
+    # the same enum, so callers may pass either form
+    _members = tuple(_property_id_enum.__members__.values())
+    _VALID_PROPERTY_IDS = frozenset(_members + tuple(getattr(member, 'value', member) for member in _members))
+elif _property_id_enum is not None:
+    _VALID_PROPERTY_IDS = frozenset(
+        getattr(_property_id_enum, attr_name)
+        for attr_name in dir(_property_id_enum)
+        if not attr_name.startswith('_')
+    )
+else:
+    _VALID_PROPERTY_IDS = frozenset()
+
+
 def is_valid_property_id(property_id: int) -> bool:
     """Check if a property ID is valid for Canon EDSDK.
     
@@ -257,11 +320,4 @@ def is_valid_property_id(property_id: int) -> bool:
     if not edsdk_bindings:
         return True  # Can't validate without bindings
     
-    # Get all property IDs from the EdsPropertyID enum
-    valid_ids = []
-    if hasattr(edsdk_bindings, 'EdsPropertyID'):
-        for attr_name in dir(edsdk_bindings.EdsPropertyID):
-            if not attr_name.startswith('_'):
-                valid_ids.append(getattr(edsdk_bindings.EdsPropertyID, attr_name))
-    
-    return property_id in valid_ids 
\ No newline at end of file
+    return property_id in _VALID_PROPERTY_IDS
\ No newline at end of file